@@ -8,4 +8,6 @@ class Config(BaseModel):
     client_request_subscription: str = "assistant/comms_bridge/+/+/input"
     intent_result_topic: str = "assistant/intent_engine/result"
     spacy_model: str = "en_core_web_md"
+    spacy_excluded_components: list[str] = ["ner"]
+    nlp_cache_size: int = 256
     available_rooms: list[str] = ["living room", "kitchen", "bathroom"]
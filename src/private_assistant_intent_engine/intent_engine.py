@@ -1,9 +1,12 @@
+import asyncio
+import concurrent.futures
 import logging
 import re
 
 import aiomqtt
 import spacy
 from private_assistant_commons import messages, mqtt_tools
+from spacy.tokens import Doc
 
 from private_assistant_intent_engine import config, text_tools
 
@@ -25,11 +28,28 @@ class IntentEngine:
         self.logger = logger
         self.command_split = re.compile(r"in addition,?|besides,?", flags=re.IGNORECASE)
         self.available_rooms = {room.lower() for room in config_obj.available_rooms}
+        # A single worker: listen_to_messages awaits each message anyway, and the pipeline never runs on two threads
+        self.nlp_executor = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="nlp")
+        # Only used from the single NLP worker thread, so it needs no lock
+        self.doc_cache: dict[str, Doc] = {}
+
+    def parse_commands(self, commands: list[str]) -> list[Doc]:
+        """Run the NLP pipeline on all commands in one batch, reusing the Docs of recently seen identical commands."""
+        docs = {command: self.doc_cache.pop(command) for command in commands if command in self.doc_cache}
+        uncached = [command for command in dict.fromkeys(commands) if command not in docs]
+        docs.update(zip(uncached, self.nlp_model.pipe(uncached), strict=True))
+        if self.config_obj.nlp_cache_size > 0:
+            for command, doc in docs.items():
+                if len(self.doc_cache) >= self.config_obj.nlp_cache_size:
+                    # Dicts keep insertion order, so the first key is the least recently used command
+                    del self.doc_cache[next(iter(self.doc_cache))]
+                self.doc_cache[command] = doc
+        return [docs[command] for command in commands]
 
     def analyze_text(self, client_request: messages.ClientRequest) -> list[messages.IntentAnalysisResult]:
         intent_analysis_results = []
-        for command in [artifact.strip() for artifact in self.command_split.split(client_request.text)]:
-            doc = self.nlp_model(command)
+        commands = [artifact.strip() for artifact in self.command_split.split(client_request.text)]
+        for command, doc in zip(commands, self.parse_commands(commands), strict=True):
             intent_analysis_result = messages.IntentAnalysisResult.model_construct(
                 client_request=client_request.model_copy(update={"text": command})
             )
@@ -47,19 +67,23 @@ class IntentEngine:
 
         return intent_analysis_results
 
-    async def handle_intent_input_message(self, payload: str) -> None:
+    async def handle_intent_input_message(self, payload: str | bytes | bytearray) -> None:
         client_request = messages.ClientRequest.model_validate_json(payload)
-        intent_analysis_results = self.analyze_text(client_request=client_request)
+        # spaCy releases the GIL in its pipeline components, so running it in a thread keeps MQTT I/O responsive
+        intent_analysis_results = await asyncio.get_running_loop().run_in_executor(
+            self.nlp_executor, self.analyze_text, client_request
+        )
 
         self.logger.info("Analysis successful, publishing results.")
         for result in intent_analysis_results:
             await self.mqtt_client.publish(self.config_obj.intent_result_topic, result.model_dump_json(), qos=1)
 
-    def decode_message_payload(self, payload) -> str | None:
-        """Decode the message payload if it is a suitable type."""
-        if isinstance(payload, bytes | bytearray):
-            return payload.decode("utf-8")
-        if isinstance(payload, str):
+    def decode_message_payload(self, payload) -> str | bytes | bytearray | None:
+        """Return the payload unchanged if pydantic can parse it as JSON, otherwise None.
+
+        Nothing is decoded: model_validate_json reads str, bytes and bytearray directly.
+        """
+        if isinstance(payload, str | bytes | bytearray):
             return payload
         self.logger.warning("Unexpected payload type: %s", type(payload))
         return None
@@ -75,6 +99,6 @@ class IntentEngine:
             self.logger.debug("Received message on topic %s", message.topic)
 
             if self.client_request_pattern.match(message.topic.value):
-                payload_str = self.decode_message_payload(message.payload)
-                if payload_str is not None:
-                    await self.handle_intent_input_message(payload_str)
+                payload = self.decode_message_payload(message.payload)
+                if payload is not None:
+                    await self.handle_intent_input_message(payload)
@@ -1,5 +1,6 @@
 import asyncio
 import pathlib
+import sys
 from typing import Annotated
 
 import aiomqtt
@@ -15,7 +16,12 @@ app = typer.Typer()
 
 @app.command()
 def main(config_path: Annotated[pathlib.Path, typer.Argument(envvar="PRIVATE_ASSISTANT_CONFIG_PATH")]) -> None:
-    asyncio.run(start_intent_engine(config_path))
+    if sys.platform != "win32":
+        import uvloop
+
+        uvloop.run(start_intent_engine(config_path))
+    else:
+        asyncio.run(start_intent_engine(config_path))
 
 
 async def start_intent_engine(
@@ -27,19 +33,20 @@ async def start_intent_engine(
         client = aiomqtt.Client(config_obj.mqtt_server_host, port=config_obj.mqtt_server_port, logger=logger)
     else:
         raise ValueError("Unknown mqtt config option combination.")
+    # Load the model and build the engine once per process; reconnects to the broker reuse them,
+    # together with the engine's NLP worker thread and Doc cache
+    nlp_model = spacy.load(config_obj.spacy_model, exclude=config_obj.spacy_excluded_components)
+    intent_engine_instance = intent_engine.IntentEngine(
+        mqtt_client=client,
+        config_obj=config_obj,
+        nlp_model=nlp_model,
+        logger=logger,
+    )
     while True:
         try:
             async with client as mqtt_client:
                 logger.info("Connected successfully to MQTT broker.")
 
-                # Create and manage the task group context
-                intent_engine_instance = intent_engine.IntentEngine(
-                    mqtt_client=client,
-                    config_obj=config_obj,
-                    nlp_model=spacy.load(config_obj.spacy_model),
-                    logger=logger,
-                )
-
                 # Set up subscriptions
                 await intent_engine_instance.setup_subscriptions()
 
@@ -1,6 +1,7 @@
 import logging
 
 from private_assistant_commons.messages import NumberAnalysisResult
+from spacy.symbols import NOUN, NUM, PROPN, VERB  # type: ignore[import-not-found]
 from spacy.tokens import Doc, Span
 from text_to_num import text2num
 
@@ -21,7 +22,7 @@ def extract_numbers_from_text(doc: Doc | Span, logger: logging.Logger | None = N
     numbers_found = []
 
     for token in doc:
-        if token.like_num or token.pos_ == "NUM":
+        if token.like_num or token.pos == NUM:
             number = parse_number(token.text, logger)
             if number is None:
                 continue
@@ -31,12 +32,10 @@ def extract_numbers_from_text(doc: Doc | Span, logger: logging.Logger | None = N
             prev_token = doc[token.i - 1] if token.i - 1 >= 0 else None
 
             if next_token:
-                object_units.next_token = next_token.lemma_ if next_token.pos_ == "VERB" else next_token.text.lower()
+                object_units.next_token = next_token.lemma_ if next_token.pos == VERB else next_token.lower_
 
             if prev_token:
-                object_units.previous_token = (
-                    prev_token.lemma_ if prev_token.pos_ == "VERB" else prev_token.text.lower()
-                )
+                object_units.previous_token = prev_token.lemma_ if prev_token.pos == VERB else prev_token.lower_
 
             numbers_found.append(object_units)
 
@@ -44,7 +43,7 @@ def extract_numbers_from_text(doc: Doc | Span, logger: logging.Logger | None = N
 
 
 def extract_verbs_and_subjects(doc: Doc | Span) -> tuple[list[str], list[str]]:
-    verbs = [token.lemma_ for token in doc if token.pos_ == "VERB"]
-    nouns = [token.text.lower() for token in doc if token.pos_ in ["NOUN", "PROPN"]]
+    verbs = [token.lemma_ for token in doc if token.pos == VERB]
+    nouns = [token.lower_ for token in doc if token.pos in (NOUN, PROPN)]
 
     return verbs, nouns
@@ -0,0 +1,62 @@
+import pathlib
+
+import pytest
+import yaml
+
+from private_assistant_intent_engine.config import Config
+
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader  # type: ignore[assignment]
+
+
+@pytest.fixture(scope="session")
+def valid_config_data():
+    """Parse the sample configuration once per test session."""
+    return yaml.load((pathlib.Path(__file__).parent / "data" / "config.yaml").read_text(), Loader=SafeLoader)
+
+
+@pytest.fixture(scope="session")
+def valid_config(valid_config_data):
+    """Validated sample configuration, shared read-only across tests."""
+    return Config.model_validate(valid_config_data)
+
+
+@pytest.fixture(scope="session")
+def nlp_model():
+    """Load the spaCy model once per test session; tests only read from it.
+
+    NER is never consulted by the engine, so it is not loaded at all. spaCy is imported here rather than at
+    module level so that runs which only select the config tests never import it.
+    """
+    import spacy
+
+    return spacy.load("en_core_web_md", exclude=["ner"])
+
+
+@pytest.fixture(scope="session")
+def blank_nlp_model():
+    """Tokenizer-only English pipeline for engine tests that do not depend on tagging or parsing."""
+    import spacy
+
+    return spacy.blank("en")
+
+
+class RecordingMQTT:
+    """Lightweight stand-in for ``aiomqtt.Client`` that records subscribe and publish calls."""
+
+    def __init__(self):
+        self.subscribe_calls: list[dict] = []
+        self.publish_calls: list[dict] = []
+
+    async def subscribe(self, topic, qos=0):
+        self.subscribe_calls.append({"topic": topic, "qos": qos})
+
+    async def publish(self, topic, payload=None, qos=0):
+        self.publish_calls.append({"topic": topic, "payload": payload, "qos": qos})
+
+
+@pytest.fixture
+def recording_mqtt():
+    return RecordingMQTT()
@@ -1,5 +1,3 @@
-import pathlib
-
 import pytest
 import yaml
 from pydantic import ValidationError
@@ -16,18 +14,13 @@ client_id: 12345  # invalid type
 """
 
 
-def test_load_valid_config():
-    data_directory = pathlib.Path(__file__).parent / "data" / "config.yaml"
-    with data_directory.open("r") as file:
-        config_data = yaml.safe_load(file)
-    config = Config.model_validate(config_data)
-
-    assert config.mqtt_server_host == "test_host"
-    assert config.mqtt_server_port == 1884
-    assert config.client_id == "test_client"
-    assert config.client_request_subscription == "test/+/+/input"
-    assert config.intent_result_topic == "test/result"
-    assert config.spacy_model == "en_core_web_sm"
+def test_load_valid_config(valid_config):
+    assert valid_config.mqtt_server_host == "test_host"
+    assert valid_config.mqtt_server_port == 1884
+    assert valid_config.client_id == "test_client"
+    assert valid_config.client_request_subscription == "test/+/+/input"
+    assert valid_config.intent_result_topic == "test/result"
+    assert valid_config.spacy_model == "en_core_web_sm"
 
 
 def test_load_invalid_config():
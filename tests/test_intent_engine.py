@@ -1,33 +1,44 @@
+import asyncio
+import itertools
+import logging
 import uuid
-from unittest.mock import Mock
 
 import pytest
-import spacy
-from private_assistant_commons.messages import ClientRequest
+from private_assistant_commons.messages import ClientRequest, IntentAnalysisResult
 
 from private_assistant_intent_engine import config
 from private_assistant_intent_engine.intent_engine import IntentEngine
 
+_uid = itertools.count(1)
+
+
+def _uuid() -> uuid.UUID:
+    """Deterministic ids; the tests do not need random UUIDs."""
+    return uuid.UUID(int=next(_uid))
+
+
+@pytest.fixture
+def intent_engine(recording_mqtt, nlp_model):
+    return IntentEngine(config.Config(), recording_mqtt, nlp_model, logging.getLogger(__name__))
+
 
 @pytest.fixture
-def intent_engine():
-    config_mock = config.Config()
-    mqtt_client_mock = Mock()
-    logger_mock = Mock()
-    nlp_model = spacy.load("en_core_web_md")
-    return IntentEngine(config_mock, mqtt_client_mock, nlp_model, logger_mock)
+def blank_intent_engine(recording_mqtt, blank_nlp_model):
+    return IntentEngine(config.Config(), recording_mqtt, blank_nlp_model, logging.getLogger(__name__))
 
 
 @pytest.fixture
 def client_request() -> ClientRequest:
-    return ClientRequest(
-        id=uuid.uuid4(),
+    # Test data is known to be valid, so skip pydantic validation
+    return ClientRequest.model_construct(
+        id=_uuid(),
         room="livingroom",
         output_topic="test/test/stuff",
         text="Turn on the lights in room kitchen. In addition, Set the temperature to 22 degrees.",
     )
 
 
+@pytest.mark.slow
 def test_analyze_text_command_split(intent_engine, client_request):
     results = intent_engine.analyze_text(client_request)
     assert len(results) == 2
@@ -45,9 +56,10 @@ def test_analyze_text_command_split(intent_engine, client_request):
     assert any(num.number_token == 22 for num in results[1].numbers)
 
 
+@pytest.mark.slow
 def test_analyze_text_all_rooms(intent_engine):
     request = ClientRequest(
-        id=uuid.uuid4(),
+        id=_uuid(),
         room="livingroom",
         output_topic="test/test/stuff",
         text="Turn on the lights in all rooms",
@@ -63,11 +75,98 @@ def test_analyze_text_all_rooms(intent_engine):
     assert set(results[0].rooms) == {"living room", "kitchen", "bathroom"}
 
 
-def test_analyze_text_preserves_request_attributes(intent_engine, client_request):
-    results = intent_engine.analyze_text(client_request)
+def test_analyze_text_reports_every_contained_room(recording_mqtt, blank_nlp_model):
+    config_obj = config.Config(available_rooms=["bathroom", "guest bathroom"])
+    engine = IntentEngine(config_obj, recording_mqtt, blank_nlp_model, logging.getLogger(__name__))
+    request = ClientRequest(
+        id=_uuid(),
+        room="livingroom",
+        output_topic="test/test/stuff",
+        text="Turn on the lights in the guest bathroom",
+    )
+
+    (result,) = engine.analyze_text(request)
+    assert set(result.rooms) == {"bathroom", "guest bathroom"}
+
+
+def test_analyze_text_preserves_request_attributes(blank_intent_engine, client_request):
+    results = blank_intent_engine.analyze_text(client_request)
 
     for result in results:
         # Verify all attributes except text remain unchanged
         assert result.client_request.id == client_request.id
         assert result.client_request.room == client_request.room
         assert result.client_request.output_topic == client_request.output_topic
+
+
+def test_parse_commands_reuses_doc_for_repeated_command(blank_intent_engine):
+    (doc,) = blank_intent_engine.parse_commands(["Turn on the lights"])
+
+    assert blank_intent_engine.parse_commands(["Turn on the lights"])[0] is doc
+    assert blank_intent_engine.parse_commands(["Turn off the lights"])[0] is not doc
+
+
+def test_parse_commands_evicts_least_recently_used(recording_mqtt, blank_nlp_model):
+    config_obj = config.Config(nlp_cache_size=2)
+    engine = IntentEngine(config_obj, recording_mqtt, blank_nlp_model, logging.getLogger(__name__))
+    first, second = engine.parse_commands(["first", "second"])
+
+    # Touch "first" so that "second" becomes the least recently used entry
+    assert engine.parse_commands(["first"])[0] is first
+    engine.parse_commands(["third"])
+
+    assert list(engine.doc_cache) == ["first", "third"]
+    assert engine.parse_commands(["second"])[0] is not second
+
+
+def test_parse_commands_without_cache(recording_mqtt, blank_nlp_model):
+    config_obj = config.Config(nlp_cache_size=0)
+    engine = IntentEngine(config_obj, recording_mqtt, blank_nlp_model, logging.getLogger(__name__))
+    (doc,) = engine.parse_commands(["Turn on the lights"])
+
+    assert engine.doc_cache == {}
+    assert engine.parse_commands(["Turn on the lights"])[0] is not doc
+
+
+def test_decode_message_payload_passes_payload_through(blank_intent_engine):
+    payload = b'{"text": "Turn on the lights"}'
+
+    assert blank_intent_engine.decode_message_payload(payload) is payload
+    payload_array = bytearray(payload)
+    assert blank_intent_engine.decode_message_payload(payload_array) is payload_array
+    assert blank_intent_engine.decode_message_payload(payload.decode()) == payload.decode()
+    assert blank_intent_engine.decode_message_payload(42) is None
+
+
+def test_setup_subscriptions_uses_configured_topic(blank_intent_engine):
+    asyncio.run(blank_intent_engine.setup_subscriptions())
+
+    assert blank_intent_engine.mqtt_client.subscribe_calls == [
+        {"topic": blank_intent_engine.config_obj.client_request_subscription, "qos": 1}
+    ]
+
+
+@pytest.mark.slow
+def test_handle_intent_input_message_publishes_results(intent_engine, client_request):
+    asyncio.run(intent_engine.handle_intent_input_message(client_request.model_dump_json()))
+
+    publish_calls = intent_engine.mqtt_client.publish_calls
+    assert len(publish_calls) == 2
+    assert all(call["topic"] == intent_engine.config_obj.intent_result_topic for call in publish_calls)
+    assert all(call["qos"] == 1 for call in publish_calls)
+
+    result = IntentAnalysisResult.model_validate_json(publish_calls[1]["payload"])
+    assert result.client_request.text == "Set the temperature to 22 degrees."
+    assert any(num.number_token == 22 for num in result.numbers)
+
+
+def test_handle_intent_input_message_accepts_bytes(blank_intent_engine, client_request):
+    asyncio.run(blank_intent_engine.handle_intent_input_message(client_request.model_dump_json().encode()))
+
+    publish_calls = blank_intent_engine.mqtt_client.publish_calls
+    assert len(publish_calls) == 2
+
+    result = IntentAnalysisResult.model_validate_json(publish_calls[0]["payload"])
+    assert result.client_request.id == client_request.id
+    assert result.client_request.text == "Turn on the lights in room kitchen."
+    assert result.rooms == ["kitchen"]